@@ -52,7 +52,7 @@ async def main():
         
         if bulk_response.status != "COMPLETED":
             print("Waiting for job to complete...")
-            job = await skrape.get_job(bulk_response.jobId)
+            job = await skrape.wait_for_job(bulk_response.jobId)
             print(f"Final Status: {job.status}")
             if job.result:
                 print("\nMarkdown results:")
@@ -66,7 +66,7 @@ async def main():
         
         if crawl_response.status != "COMPLETED":
             print("Waiting for job to complete...")
-            job = await skrape.get_job(crawl_response.jobId)
+            job = await skrape.wait_for_job(crawl_response.jobId)
             print(f"Final Status: {job.status}")
             if job.result:
                 print("\nCrawl results:")
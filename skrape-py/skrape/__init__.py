@@ -1,4 +1,5 @@
+from .cache import Cache
 from .client import Skrape
-from .errors import SkrapeAPIError, SkrapeValidationError
+from .errors import SkrapeAPIError, SkrapeRateLimitError, SkrapeValidationError
 
-__all__ = ["Skrape", "SkrapeAPIError", "SkrapeValidationError"]
+__all__ = ["Cache", "Skrape", "SkrapeAPIError", "SkrapeRateLimitError", "SkrapeValidationError"]
@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+import hashlib
+import time
+
+class Cache:
+    """In-memory LRU cache for API responses, with entries expiring after a TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses kept; the least recently used are evicted first (default: 1024)
+            ttl: Seconds a cached response stays valid (default: 300)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: bytes) -> bytes:
+        """Build a cache key by hashing the given request parts."""
+        digest = hashlib.sha256()
+        for part in parts:
+            # Length-prefix each part so different splits can't collide
+            digest.update(len(part).to_bytes(8, "big"))
+            digest.update(part)
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached response for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        """Store a response under key, evicting the least recently used if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: bytes) -> None:
+        """Remove the response cached under key, if any."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,10 +1,265 @@
-from typing import TypeVar, Generic, Any, Dict, Optional, Union, List
+from typing import TypeVar, Generic, Any, AsyncIterator, Dict, NoReturn, Optional, Union, List
+import asyncio
 import json
+import os
+import random
+import uuid
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import httpx
 from pydantic import BaseModel
-from .errors import SkrapeAPIError, SkrapeValidationError
+from .cache import Cache
+from .errors import SkrapeAPIError, SkrapeRateLimitError, SkrapeValidationError
+
+try:
+    import orjson
+except ImportError:  # Optional, installed with the "fast" extra
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional, installed with the "stream" extra
+    ijson = None
+
+# Opt-in: run asyncio on uvloop when SKRAPE_USE_UVLOOP=1 and uvloop is installed
+if os.getenv("SKRAPE_USE_UVLOOP") == "1":
+    try:
+        import uvloop
+    except ImportError:  # Optional, installed with the "fast" extra
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Parse response bodies straight from bytes, preferring orjson when available
+_loads = orjson.loads if orjson is not None else json.loads
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a request payload to compact JSON bytes with the stdlib encoder."""
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+# orjson options matching the stdlib encoder, which turns non-string dict keys into strings
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+def _orjson_dumps(obj: Any) -> bytes:
+    """Serialize a request payload to JSON bytes with orjson."""
+    return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+# Serialize request bodies to bytes, preferring orjson when available
+_dumps = _orjson_dumps if orjson is not None else _json_dumps
+
+def _dumps_sorted(obj: Any) -> bytes:
+    """Serialize with sorted keys using the same encoder as request bodies."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, separators=(",", ":"), sort_keys=True).encode()
 
 T = TypeVar("T", bound=BaseModel)
+M = TypeVar("M", bound=BaseModel)
+
+# Longest Retry-After delay that is waited out automatically before giving up
+_MAX_RETRY_AFTER = 60.0
+
+# Error messages for HTTP status codes with a known meaning
+_STATUS_MESSAGES = {
+    401: "Invalid or missing API key",
+    503: "Server too busy, please retry",
+}
+
+def _raise_api_error(e: httpx.HTTPError) -> NoReturn:
+    """Raise a SkrapeAPIError describing a failed HTTP request."""
+    if isinstance(e, httpx.HTTPStatusError):
+        message = _STATUS_MESSAGES.get(e.response.status_code)
+        if message is not None:
+            raise SkrapeAPIError(message)
+    raise SkrapeAPIError(f"API request failed: {str(e)}")
+
+# Extra seconds the HTTP read timeout allows beyond a server-side wait
+_WAIT_TIMEOUT_MARGIN = 10.0
+
+# Job statuses after which polling stops
+_TERMINAL_STATUSES = frozenset({"COMPLETED", "FAILED"})
+
+def _parse_retry_after(value: Optional[str], default: float = 10.0) -> float:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+# Connection pool settings for the per-client transport. Keepalive connections
+# are reused across extract/markdown/crawl/get_job calls to the same host.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0
+)
+
+# Connection pool settings for the transport shared by all clients
+_SHARED_POOL_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0
+)
+
+def _make_transport(limits: httpx.Limits) -> httpx.AsyncHTTPTransport:
+    """Create a pooled HTTP/2 transport with the given limits."""
+    return httpx.AsyncHTTPTransport(
+        verify=True,  # Verify SSL certificates
+        http2=True,  # Multiplex concurrent requests over one connection
+        limits=limits,
+        retries=0
+    )
+
+class _SharedPool:
+    """A connection pool on one event loop and the number of clients using it."""
+    __slots__ = ("transport", "clients")
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport):
+        self.transport = transport
+        self.clients = 0
+
+# Connection pools shared by Skrape clients, one per event loop
+_SHARED_POOLS: Dict[asyncio.AbstractEventLoop, _SharedPool] = {}
+
+def _drop_closed_pools() -> None:
+    """Forget the pools of event loops that have been closed."""
+    for loop in [loop for loop in _SHARED_POOLS if loop.is_closed()]:
+        del _SHARED_POOLS[loop]
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """A client's handle on the connection pool shared by all clients on its event loop.
+
+    Connections can't be used across event loops, so one pool is kept per loop.
+    The pool is closed when the last client using it is closed, and pools left
+    behind on closed loops are dropped when a new pool is created.
+    """
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The pool left behind on another loop can't be closed from this one
+            self._release()
+            pool = _SHARED_POOLS.get(loop)
+            if pool is None:
+                _drop_closed_pools()
+                pool = _SHARED_POOLS[loop] = _SharedPool(_make_transport(_SHARED_POOL_LIMITS))
+            pool.clients += 1
+            self._loop = loop
+        return await _SHARED_POOLS[loop].transport.handle_async_request(request)
+
+    def _release(self) -> Optional[_SharedPool]:
+        """Stop using the current pool, returning it if no other client uses it."""
+        loop, self._loop = self._loop, None
+        pool = _SHARED_POOLS.get(loop) if loop is not None else None
+        if pool is None:
+            return None
+        pool.clients -= 1
+        if pool.clients > 0:
+            return None
+        del _SHARED_POOLS[loop]
+        return pool
+
+    async def aclose(self) -> None:
+        loop = self._loop
+        pool = self._release()
+        if pool is not None and loop is asyncio.get_running_loop():
+            await pool.transport.aclose()
+
+# Serialized JSON schemas generated from Pydantic models, keyed by model class.
+_SCHEMA_JSON_CACHE: Dict[type[BaseModel], bytes] = {}
+
+def _get_schema_json(schema: type[BaseModel]) -> bytes:
+    """Return the serialized JSON schema for a Pydantic model, generating it only once."""
+    schema_json = _SCHEMA_JSON_CACHE.get(schema)
+    if schema_json is None:
+        schema_json = _SCHEMA_JSON_CACHE.setdefault(
+            schema, _dumps(schema.model_json_schema())
+        )
+    return schema_json
+
+class _ResultItemParser:
+    """Incrementally parse job result items out of a streamed get-job response body.
+
+    The job is either nested under "result" ({"result": {"jobId": ..., "result": [...]}})
+    or at the top level ({"jobId": ..., "result": [...]}). The shape is detected
+    from the body so that only the job's own result list is read.
+    """
+    def __init__(self):
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+        self._builder = None
+        self._job_prefix: Optional[str] = None
+        self._fields: Dict[str, Any] = {}
+
+    @property
+    def status(self) -> Optional[str]:
+        """The job status, once it has been parsed."""
+        return self._field("status")
+
+    @property
+    def error(self) -> Optional[str]:
+        """The job error, once it has been parsed."""
+        return self._field("error")
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parse the next chunk of the body and return the items it completed."""
+        self._parser.send(chunk)
+        return self._drain()
+
+    def close(self) -> List[Any]:
+        """Finish parsing and return any remaining items."""
+        self._parser.close()
+        return self._drain()
+
+    def _field(self, name: str) -> Any:
+        if self._job_prefix is None:
+            return None
+        return self._fields.get(f"{self._job_prefix}{name}")
+
+    def _drain(self) -> List[Any]:
+        items = []
+        for prefix, event, value in self._events:
+            if self._builder is not None:
+                self._builder.event(event, value)
+                if prefix == self._job_prefix + "result.item" and event in ("end_map", "end_array"):
+                    items.append(self._builder.value)
+                    self._builder = None
+                continue
+
+            if self._job_prefix is None:
+                if prefix == "result" and event == "start_map":
+                    self._job_prefix = "result."
+                elif (prefix == "result" and event == "start_array") or (
+                    prefix == "" and event == "map_key" and value in ("jobId", "status")
+                ):
+                    self._job_prefix = ""
+
+            if prefix in ("status", "error", "result.status", "result.error"):
+                self._fields[prefix] = value
+            elif self._job_prefix is not None and prefix == self._job_prefix + "result.item":
+                if event in ("start_map", "start_array"):
+                    self._builder = ijson.ObjectBuilder()
+                    self._builder.event(event, value)
+                else:
+                    items.append(value)
+        del self._events[:]
+        return items
+
+def _raise_if_failed(job_id: str, status: Optional[str], error: Optional[str]) -> None:
+    """Raise a SkrapeAPIError if the job has failed."""
+    if status == "FAILED":
+        raise SkrapeAPIError(f"Job {job_id} failed: {error}" if error else f"Job {job_id} failed")
 
 class RateLimit(BaseModel):
     """Rate limit information."""
@@ -20,6 +275,8 @@ class UsageInfo(BaseModel):
 
 class ExtractResponse(Generic[T]):
     """Response from the extract endpoint."""
+    __slots__ = ("result", "usage")
+
     def __init__(self, result: T, usage: UsageInfo):
         self.result = result
         self.usage = usage
@@ -39,40 +296,110 @@ class JobResponse(BaseModel):
 class Skrape(Generic[T]):
     """Client for interacting with the Skrape.ai API."""
     
-    def __init__(self, api_key: str, base_url: str = "https://skrape.ai/api"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://skrape.ai/api",
+        max_retries: int = 3,
+        shared_transport: bool = True,
+        cache: Optional[Cache] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """Initialize the Skrape client.
         
         Args:
             api_key: Your Skrape.ai API key
             base_url: Base URL for the Skrape.ai API (default: https://skrape.ai/api)
+            max_retries: How many times a rate limited request is retried (default: 3)
+            shared_transport: Pool connections with other Skrape clients on the same
+                event loop instead of opening a separate pool for this client (default: True)
+            cache: Optional Cache for completed extract and markdown responses. Identical
+                requests are answered from it without calling the API (default: None)
+            transport: Optional httpx transport to send requests through instead of the
+                built-in connection pool, e.g. httpx.MockTransport in tests (default: None)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")  # Remove trailing slash if present
-        self.headers = {
+        self.max_retries = max_retries
+        self.cache = cache
+        self._url_extract = f"{self.base_url}/extract"
+        self._url_markdown = f"{self.base_url}/markdown"
+        self._url_markdown_bulk = f"{self.base_url}/markdown/bulk"
+        self._url_crawl = f"{self.base_url}/crawl"
+        self._url_get_job = f"{self.base_url}/get-job"
+        # Accept-Encoding is left to httpx, which advertises br when brotli is installed
+        self.headers = httpx.Headers({
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
-        }
-        self.client = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create an HTTP client."""
-        if self.client is None:
-            self.client = httpx.AsyncClient(
-                headers=self.headers,
-                verify=True,  # Verify SSL certificates
-                timeout=30.0,  # 30 seconds timeout
-                follow_redirects=True
-            )
+        })
+        self._shared_transport = shared_transport
+        self._transport = transport
+        self.client = self._create_client()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the HTTP client used for API requests."""
+        if self._transport is not None:
+            transport = self._transport
+        elif self._shared_transport:
+            transport = _SharedTransport()
+        else:
+            transport = _make_transport(_POOL_LIMITS)
+        return httpx.AsyncClient(
+            headers=self.headers,
+            transport=transport,
+            timeout=30.0,  # 30 seconds timeout
+            follow_redirects=True
+        )
+
+    def _open_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client, creating a new one if it has been closed."""
+        if self.client.is_closed:
+            self.client = self._create_client()
         return self.client
 
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        max_retries: Optional[int] = None,
+        stream: bool = False,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, retrying rate limited responses after the Retry-After delay.
+
+        max_retries overrides the client's retry count for this request. With
+        stream=True the body is not read, and the caller must close the response.
+        """
+        if max_retries is None:
+            max_retries = self.max_retries
+        client = self._open_client()
+        request = client.build_request(method, url, **kwargs)
+        attempt = 0
+        while True:
+            response = await client.send(request, stream=stream)
+            if response.status_code != 429 or attempt >= max_retries:
+                return response
+            await response.aclose()
+
+            # Long rate limit windows are surfaced to the caller instead of waited out
+            delay = _parse_retry_after(response.headers.get("Retry-After"))
+            if delay > _MAX_RETRY_AFTER:
+                return response
+            await asyncio.sleep(delay + random.uniform(0, 0.25 * delay))
+            attempt += 1
+
     async def _handle_response(self, response: httpx.Response) -> Dict:
         """Handle API response and common error cases."""
         if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", "10"))
-            raise SkrapeAPIError(f"Rate limit exceeded. Try again in {retry_after} seconds")
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            raise SkrapeRateLimitError(
+                f"Rate limit exceeded. Try again in {retry_after:g} seconds",
+                retry_after=retry_after
+            )
         
         response.raise_for_status()
-        data = response.json()
+
+        data = _loads(response.content)
         
         # For async endpoints, job info is in result
         if "result" in data and isinstance(data["result"], dict):
@@ -94,6 +421,62 @@ class Skrape(Generic[T]):
         # For sync endpoints, return as is
         return data
 
+    async def _post_json(
+        self,
+        url: str,
+        payload: Union[Dict[str, Any], bytes],
+        model: type[M],
+        cache_key: Optional[bytes] = None,
+        **kwargs: Any
+    ) -> M:
+        """POST a JSON payload and validate the response as the given model.
+
+        The payload may be passed already serialized. With a cache key, a cached
+        response is returned without calling the API and completed responses are
+        added to the cache. Retries of the request share one Idempotency-Key.
+        """
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        # A fresh key per call lets the server deduplicate this call's retries only
+        kwargs["headers"] = {"Idempotency-Key": uuid.uuid4().hex}
+
+        try:
+            body = payload if isinstance(payload, bytes) else _dumps(payload)
+            response = await self._request("POST", url, content=body, **kwargs)
+            data = await self._handle_response(response)
+            result = model.model_validate(data)
+
+        except httpx.HTTPError as e:
+            _raise_api_error(e)
+
+        # Jobs still in progress would go stale in the cache
+        if cache_key is not None and getattr(result, "status", "COMPLETED") == "COMPLETED":
+            self.cache.set(cache_key, result)
+        return result
+
+    def cache_key(
+        self,
+        url: str,
+        schema: Optional[type[T]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """Return the cache key of an extract request, or of a markdown request if no schema is given.
+
+        Keys include the API endpoint and key, so clients sharing a cache never
+        see each other's responses.
+        """
+        return Cache.make_key(
+            b"extract" if schema is not None else b"markdown",
+            self.base_url.encode(),
+            self.api_key.encode(),
+            url.encode(),
+            _get_schema_json(schema) if schema is not None else b"",
+            # Encoded like the request body, so any options it accepts work here too
+            _dumps_sorted(options or {})
+        )
+
     async def extract(
         self, 
         url: str, 
@@ -115,27 +498,58 @@ class Skrape(Generic[T]):
             SkrapeAPIError: If the API request fails
             SkrapeValidationError: If the response doesn't match the schema
         """
+        # Splice the cached schema JSON into the body instead of re-encoding it
+        body = b'{"url":%s,"schema":%s,"options":%s}' % (
+            _dumps(url),
+            _get_schema_json(schema),
+            _dumps(options or {})
+        )
+        key = self.cache_key(url, schema, options) if self.cache is not None else None
+
+        return await self._post_json(self._url_extract, body, JobResponse, cache_key=key)
+
+    async def extract_many(
+        self,
+        urls: List[str],
+        schema: type[T],
+        options: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 20
+    ) -> List[JobResponse]:
+        """
+        Extract data from multiple URLs concurrently using the provided Pydantic schema.
+
+        Args:
+            urls: The URLs to scrape
+            schema: A Pydantic model class defining the expected data structure
+            options: Optional dictionary of scraping options applied to every URL
+            max_concurrency: Maximum number of extract requests in flight at once (default: 20)
+
+        Returns:
+            List of JobResponse objects, in the same order as urls
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+            SkrapeAPIError: If any of the API requests fail; the remaining requests are cancelled
+            SkrapeValidationError: If a response doesn't match the schema
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract_one(url: str) -> JobResponse:
+            async with semaphore:
+                return await self.extract(url, schema, options)
+
+        tasks = [asyncio.ensure_future(extract_one(url)) for url in urls]
         try:
-            json_schema = schema.model_json_schema()
-            payload = {
-                "url": url,
-                "schema": json_schema,
-                "options": options or {}
-            }
-            
-            client = await self._get_client()
-            response = await client.post(f"{self.base_url}/extract", json=payload)
-            data = await self._handle_response(response)
-            
-            return JobResponse.model_validate(data)
-                
-        except httpx.HTTPError as e:
-            if isinstance(e, httpx.HTTPStatusError):
-                if e.response.status_code == 401:
-                    raise SkrapeAPIError("Invalid or missing API key")
-                elif e.response.status_code == 503:
-                    raise SkrapeAPIError("Server too busy, please retry")
-            raise SkrapeAPIError(f"API request failed: {str(e)}")
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the other requests instead of letting them spend quota in the background
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     async def markdown(
         self,
@@ -155,20 +569,10 @@ class Skrape(Generic[T]):
         Raises:
             SkrapeAPIError: If the API request fails
         """
-        try:
-            payload = {
-                "url": url,
-                "options": options or {}
-            }
+        payload = {"url": url, "options": options or {}}
+        key = self.cache_key(url, options=options) if self.cache is not None else None
 
-            client = await self._get_client()
-            response = await client.post(f"{self.base_url}/markdown", json=payload)
-            data = await self._handle_response(response)
-
-            return MarkdownResponse.model_validate(data)
-
-        except httpx.HTTPError as e:
-            raise SkrapeAPIError(f"API request failed: {str(e)}")
+        return await self._post_json(self._url_markdown, payload, MarkdownResponse, cache_key=key)
 
     async def markdown_bulk(
         self,
@@ -188,20 +592,8 @@ class Skrape(Generic[T]):
         Raises:
             SkrapeAPIError: If the API request fails
         """
-        try:
-            payload = {
-                "urls": urls,
-                "options": options or {}
-            }
-
-            client = await self._get_client()
-            response = await client.post(f"{self.base_url}/markdown/bulk", json=payload)
-            data = await self._handle_response(response)
-
-            return JobResponse.model_validate(data)
-
-        except httpx.HTTPError as e:
-            raise SkrapeAPIError(f"API request failed: {str(e)}")
+        payload = {"urls": urls, "options": options or {}}
+        return await self._post_json(self._url_markdown_bulk, payload, JobResponse)
 
     async def crawl(
         self,
@@ -221,20 +613,8 @@ class Skrape(Generic[T]):
         Raises:
             SkrapeAPIError: If the API request fails
         """
-        try:
-            payload = {
-                "urls": urls,
-                "options": options or {}
-            }
-            
-            client = await self._get_client()
-            response = await client.post(f"{self.base_url}/crawl", json=payload)
-            data = await self._handle_response(response)
-            
-            return JobResponse.model_validate(data)
-                
-        except httpx.HTTPError as e:
-            raise SkrapeAPIError(f"API request failed: {str(e)}")
+        payload = {"urls": urls, "options": options or {}}
+        return await self._post_json(self._url_crawl, payload, JobResponse)
 
     async def get_job(self, job_id: str) -> JobResponse:
         """
@@ -249,21 +629,278 @@ class Skrape(Generic[T]):
         Raises:
             SkrapeAPIError: If the API request fails
         """
+        return await self._get_job(job_id)
+
+    async def _get_job(self, job_id: str, max_retries: Optional[int] = None) -> JobResponse:
+        """Fetch a job, retrying rate limited requests max_retries times if given."""
         try:
-            client = await self._get_client()
-            response = await client.get(f"{self.base_url}/get-job?jobId={job_id}")
+            response = await self._request(
+                "GET", self._url_get_job, max_retries=max_retries, params={"jobId": job_id}
+            )
             data = await self._handle_response(response)
             
             return JobResponse.model_validate(data)
                 
         except httpx.HTTPError as e:
-            raise SkrapeAPIError(f"API request failed: {str(e)}")
+            _raise_api_error(e)
+            
+    async def iter_job_results(self, job_id: str) -> AsyncIterator[Any]:
+        """
+        Stream the results of a completed background job one item at a time.
+
+        With the optional ijson dependency installed, the response body is parsed
+        incrementally so large bulk or crawl results are never held in memory at
+        once. Without it, the body is read in full and the items yielded from it.
+        Nothing is yielded while the job has no results yet, or if its result
+        isn't a list.
+
+        Args:
+            job_id: ID of the job to read results from
+
+        Yields:
+            Each entry of the job's result list
+
+        Raises:
+            SkrapeAPIError: If the API request fails, the job has failed or the
+                response can't be parsed
+        """
+        try:
+            response = await self._request(
+                "GET", self._url_get_job, stream=True, params={"jobId": job_id}
+            )
+            try:
+                if ijson is None or response.status_code >= 400:
+                    await response.aread()
+                    try:
+                        data = await self._handle_response(response)
+                    except json.JSONDecodeError as e:
+                        raise SkrapeAPIError(f"Invalid job response: {str(e)}")
+                    job = JobResponse.model_validate(data)
+                    _raise_if_failed(job_id, job.status, job.error)
+                    # Match the streaming parser, which only reads items of a list
+                    if isinstance(job.result, list):
+                        for item in job.result:
+                            yield item
+                    return
+
+                parser = _ResultItemParser()
+                async for chunk in response.aiter_bytes():
+                    try:
+                        items = parser.feed(chunk)
+                    except ijson.JSONError as e:
+                        raise SkrapeAPIError(f"Invalid job response: {str(e)}")
+                    _raise_if_failed(job_id, parser.status, parser.error)
+                    for item in items:
+                        yield item
+
+                try:
+                    items = parser.close()
+                except ijson.JSONError as e:
+                    raise SkrapeAPIError(f"Invalid job response: {str(e)}")
+                _raise_if_failed(job_id, parser.status, parser.error)
+                for item in items:
+                    yield item
+
+            finally:
+                await response.aclose()
+
+        except httpx.HTTPError as e:
+            _raise_api_error(e)
+
+    async def wait_for_job(
+        self,
+        job_id: str,
+        timeout: float = 300.0,
+        initial_interval: float = 0.5,
+        max_interval: float = 10.0
+    ) -> JobResponse:
+        """
+        Poll a background job until it completes or fails.
+
+        The polling interval doubles after every check, up to max_interval, with
+        random jitter applied. When rate limited, polling resumes after the delay
+        the server asks for.
+
+        Args:
+            job_id: ID of the job to wait for
+            timeout: Maximum number of seconds to wait (default: 300)
+            initial_interval: Seconds to wait before the first check (default: 0.5)
+            max_interval: Upper bound on the seconds between checks (default: 10)
+
+        Returns:
+            JobResponse with status COMPLETED or FAILED
+
+        Raises:
+            SkrapeAPIError: If the API request fails or the job doesn't finish within timeout
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        return await self._poll_job(job_id, deadline, timeout, initial_interval, max_interval)
+
+    async def _poll_job(
+        self,
+        job_id: str,
+        deadline: float,
+        timeout: float,
+        initial_interval: float = 0.5,
+        max_interval: float = 10.0
+    ) -> JobResponse:
+        """Poll a background job until it finishes or the loop clock reaches deadline.
+
+        timeout is the caller's original timeout, reported if the deadline passes.
+        """
+        loop = asyncio.get_running_loop()
+        interval = initial_interval
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise SkrapeAPIError(f"Timed out waiting for job {job_id} after {timeout:g} seconds")
+
+            await asyncio.sleep(min(interval * (0.5 + random.random()), remaining))
+            interval = min(max_interval, interval * 2)
+
+            # Rate limits are waited out here against the deadline, not retried in _request
+            try:
+                job = await self._get_job(job_id, max_retries=0)
+            except SkrapeRateLimitError as e:
+                await asyncio.sleep(min(e.retry_after, max(0.0, deadline - loop.time())))
+                continue
+
+            if job.status in _TERMINAL_STATUSES:
+                return job
             
+    async def _submit_and_wait(
+        self,
+        url: str,
+        urls: List[str],
+        options: Optional[Dict[str, Any]],
+        timeout: float
+    ) -> JobResponse:
+        """Submit a bulk job asking the server to hold the response until it finishes.
+
+        Rate limited submissions are retried, and the job polled if it is still
+        running when the server responds, all within the same deadline.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        wait = timeout
+
+        # Rate limits are waited out here against the deadline, not retried in _request
+        while True:
+            payload = {"urls": urls, "options": {**(options or {}), "wait": wait}}
+            try:
+                job = await self._post_json(
+                    url, payload, JobResponse, max_retries=0, timeout=wait + _WAIT_TIMEOUT_MARGIN
+                )
+                break
+            except SkrapeRateLimitError as e:
+                await asyncio.sleep(min(e.retry_after, max(0.0, deadline - loop.time())))
+
+            wait = deadline - loop.time()
+            if wait <= 0:
+                raise SkrapeAPIError(f"Timed out submitting job after {timeout:g} seconds")
+
+        if job.status in _TERMINAL_STATUSES:
+            return job
+        return await self._poll_job(job.jobId, deadline, timeout)
+
+    async def markdown_bulk_wait(
+        self,
+        urls: List[str],
+        options: Optional[Dict[str, Any]] = None,
+        timeout: float = 30.0
+    ) -> JobResponse:
+        """
+        Convert multiple URLs to markdown and wait for the results.
+
+        The server is asked to respond once the job finishes, saving the separate
+        get_job round-trip for short jobs. Longer jobs are polled until done.
+
+        Args:
+            urls: List of URLs to convert
+            options: Optional dictionary of scraping options (e.g., renderJs, actions)
+            timeout: Maximum number of seconds to wait for the job (default: 30)
+
+        Returns:
+            JobResponse with status COMPLETED or FAILED
+
+        Raises:
+            SkrapeAPIError: If the API request fails or the job doesn't finish within timeout
+        """
+        return await self._submit_and_wait(self._url_markdown_bulk, urls, options, timeout)
+
+    async def crawl_wait(
+        self,
+        urls: List[str],
+        options: Optional[Dict[str, Any]] = None,
+        timeout: float = 30.0
+    ) -> JobResponse:
+        """
+        Crawl multiple URLs and wait for the results.
+
+        The server is asked to respond once the job finishes, saving the separate
+        get_job round-trip for short jobs. Longer jobs are polled until done.
+
+        Args:
+            urls: List of URLs to crawl
+            options: Optional dictionary of crawling options (e.g., renderJs, actions)
+            timeout: Maximum number of seconds to wait for the job (default: 30)
+
+        Returns:
+            JobResponse with status COMPLETED or FAILED
+
+        Raises:
+            SkrapeAPIError: If the API request fails or the job doesn't finish within timeout
+        """
+        return await self._submit_and_wait(self._url_crawl, urls, options, timeout)
+
+    async def _crawl_and_wait(
+        self,
+        urls: List[str],
+        options: Optional[Dict[str, Any]],
+        timeout: float
+    ) -> JobResponse:
+        """Start a crawl job and poll it until it finishes."""
+        job = await self.crawl(urls, options)
+        if job.status in _TERMINAL_STATUSES:
+            return job
+        return await self.wait_for_job(job.jobId, timeout=timeout)
+
+    async def run_crawls(
+        self,
+        batches: List[List[str]],
+        options: Optional[Dict[str, Any]] = None,
+        timeout: float = 300.0
+    ) -> List[JobResponse]:
+        """
+        Run several crawl jobs concurrently and wait for all of them to finish.
+
+        Jobs are started and polled together in a task group, so if any of them
+        fails the others are cancelled.
+
+        Args:
+            batches: One list of URLs per crawl job
+            options: Optional dictionary of crawling options applied to every job
+            timeout: Maximum number of seconds to wait for each job (default: 300)
+
+        Returns:
+            List of JobResponse objects with status COMPLETED or FAILED, in the same order as batches
+
+        Raises:
+            ExceptionGroup: Wrapping the SkrapeAPIError of any job whose request failed
+                or that didn't finish within timeout
+        """
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(self._crawl_and_wait(urls, options, timeout))
+                for urls in batches
+            ]
+        return [task.result() for task in tasks]
+
     async def __aenter__(self):
-        await self._get_client()
+        self._open_client()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.client:
-            await self.client.aclose()
-            self.client = None
+        await self.client.aclose()
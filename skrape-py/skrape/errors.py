@@ -2,6 +2,12 @@ class SkrapeAPIError(Exception):
     """Raised when the Skrape.ai API returns an error."""
     pass
 
+class SkrapeRateLimitError(SkrapeAPIError):
+    """Raised when the Skrape.ai API rate limit is exceeded."""
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
 class SkrapeValidationError(Exception):
     """Raised when the response data doesn't match the provided schema."""
     pass
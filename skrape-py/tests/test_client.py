@@ -1,9 +1,14 @@
 import pytest
-from pydantic import BaseModel
+import asyncio
+import json
+import httpx
+from pydantic import BaseModel, ValidationError
 from typing import List
 import os
+from datetime import date
 from dotenv import load_dotenv
-from skrape import Skrape, SkrapeAPIError, SkrapeValidationError
+import skrape.client as client_module
+from skrape import Cache, Skrape, SkrapeAPIError, SkrapeRateLimitError, SkrapeValidationError
 
 # Load environment variables
 load_dotenv()
@@ -162,3 +167,467 @@ async def test_rate_limit():
         
         # If we didn't hit the rate limit after 5 requests, that's fine too
         # The test is more about handling the rate limit when it occurs
+
+@pytest.mark.asyncio
+async def test_extract_many():
+    """Test concurrent extraction keeps order and respects max_concurrency."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        url = json.loads(request.content)["url"]
+        return httpx.Response(200, json={"result": {"title": url, "description": ""}})
+
+    urls = [f"https://example.com/{i}" for i in range(10)]
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        responses = await skrape.extract_many(urls, SimpleSchema, max_concurrency=3)
+
+    assert [response.result["title"] for response in responses] == urls
+    assert max_in_flight == 3
+
+@pytest.mark.asyncio
+async def test_wait_for_job():
+    """Test polling a job until it completes, waiting out rate limits."""
+    responses = [
+        httpx.Response(200, json={"result": {"jobId": "job_1", "status": "PENDING"}}),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"result": {"jobId": "job_1", "status": "RUNNING"}}),
+        httpx.Response(200, json={"result": {"jobId": "job_1", "status": "COMPLETED", "result": ["# Example"]}}),
+    ]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        job = await skrape.wait_for_job("job_1", initial_interval=0.001, max_interval=0.002)
+
+    assert job.status == "COMPLETED"
+    assert job.result == ["# Example"]
+    assert len(requests) == 4
+    assert all(request.url.params["jobId"] == "job_1" for request in requests)
+
+@pytest.mark.asyncio
+async def test_wait_for_job_timeout():
+    """Test that waiting on a job that never finishes raises after timeout."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"result": {"jobId": "job_1", "status": "PENDING"}})
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        with pytest.raises(SkrapeAPIError) as exc_info:
+            await skrape.wait_for_job("job_1", timeout=0.05, initial_interval=0.001, max_interval=0.01)
+        assert "Timed out" in str(exc_info.value)
+
+@pytest.mark.asyncio
+async def test_rate_limit_retry():
+    """Test that rate limited requests are retried after Retry-After."""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"result": {"jobId": "job_1", "status": "PENDING"}}),
+    ]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    async with Skrape(api_key="test_key", max_retries=2, transport=httpx.MockTransport(handler)) as skrape:
+        job = await skrape.crawl(["https://example.com"])
+
+    assert job.jobId == "job_1"
+    assert len(requests) == 3
+
+@pytest.mark.asyncio
+async def test_rate_limit_retries_exhausted():
+    """Test that a rate limit error is raised once retries are used up."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+    async with Skrape(api_key="test_key", max_retries=1, transport=httpx.MockTransport(handler)) as skrape:
+        with pytest.raises(SkrapeRateLimitError) as exc_info:
+            await skrape.markdown("https://example.com")
+
+    assert exc_info.value.retry_after == 0
+    assert len(requests) == 2
+
+@pytest.mark.asyncio
+async def test_iter_job_results():
+    """Test streaming job results split across response chunks."""
+    body = json.dumps({
+        "result": {
+            "jobId": "job_1",
+            "status": "COMPLETED",
+            "result": [{"url": "https://example.com", "markdown": "# Example"}, "# Example 2"]
+        }
+    }).encode()
+
+    async def chunks():
+        for i in range(0, len(body), 7):
+            yield body[i:i + 7]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=chunks())
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        results = [item async for item in skrape.iter_job_results("job_1")]
+
+    assert results == [{"url": "https://example.com", "markdown": "# Example"}, "# Example 2"]
+
+@pytest.mark.asyncio
+async def test_status_error_messages():
+    """Test that known HTTP error statuses map to readable errors on every endpoint."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        with pytest.raises(SkrapeAPIError) as exc_info:
+            await skrape.markdown_bulk(["https://example.com"])
+        assert "Server too busy, please retry" in str(exc_info.value)
+
+@pytest.mark.asyncio
+async def test_cache():
+    """Test that repeated requests are answered from the cache until invalidated."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"result": {"title": "Example", "description": ""}})
+
+    cache = Cache(maxsize=10, ttl=60.0)
+    async with Skrape(api_key="test_key", cache=cache, transport=httpx.MockTransport(handler)) as skrape:
+        first = await skrape.extract("https://example.com", SimpleSchema, {"renderJs": False})
+        second = await skrape.extract("https://example.com", SimpleSchema, {"renderJs": False})
+        assert second is first
+        assert len(requests) == 1
+        assert requests[0].headers["Idempotency-Key"]
+
+        await skrape.extract("https://example.com", SimpleSchema, {"renderJs": True})
+        assert len(requests) == 2
+        assert requests[1].headers["Idempotency-Key"] != requests[0].headers["Idempotency-Key"]
+
+        cache.invalidate(skrape.cache_key("https://example.com", SimpleSchema, {"renderJs": False}))
+        await skrape.extract("https://example.com", SimpleSchema, {"renderJs": False})
+        assert len(requests) == 3
+
+    # Clients with other API keys don't share cached responses
+    async with Skrape(api_key="other_key", cache=cache, transport=httpx.MockTransport(handler)) as skrape:
+        await skrape.extract("https://example.com", SimpleSchema, {"renderJs": False})
+        assert len(requests) == 4
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(client_module.orjson is None, reason="orjson is not installed")
+async def test_cache_options_encoding():
+    """Test that options orjson can encode in the request body also work as cache keys."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"result": {"title": "Example", "description": ""}})
+
+    options = {"since": date(2024, 1, 1)}
+    async with Skrape(api_key="test_key", cache=Cache(), transport=httpx.MockTransport(handler)) as skrape:
+        job = await skrape.extract("https://example.com", SimpleSchema, options)
+        assert await skrape.extract("https://example.com", SimpleSchema, options) is job
+
+@pytest.mark.asyncio
+async def test_non_string_option_keys():
+    """Test that option keys are encoded as strings, with or without orjson."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"result": {"jobId": "job_1", "status": "PENDING"}})
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        await skrape.crawl(["https://example.com"], {1: "x"})
+        assert skrape.cache_key("https://example.com", options={1: "x"})
+
+    assert json.loads(requests[0].content)["options"] == {"1": "x"}
+
+@pytest.mark.asyncio
+async def test_crawl_wait():
+    """Test that crawl_wait asks the server to wait and polls if the job isn't done."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(200, json={"result": {"jobId": "job_1", "status": "RUNNING"}})
+        return httpx.Response(200, json={"result": {"jobId": "job_1", "status": "COMPLETED", "result": ["page"]}})
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        job = await skrape.crawl_wait(["https://example.com"], {"renderJs": False}, timeout=5.0)
+
+    assert job.status == "COMPLETED"
+    assert json.loads(requests[0].content)["options"] == {"renderJs": False, "wait": 5.0}
+    assert len(requests) == 2
+
+@pytest.mark.asyncio
+async def test_crawl_wait_timeout():
+    """Test that crawl_wait reports its own timeout if the server holds the job past it."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"result": {"jobId": "job_1", "status": "RUNNING"}})
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        with pytest.raises(SkrapeAPIError) as exc_info:
+            await skrape.crawl_wait(["https://example.com"], timeout=0.05)
+
+    assert "after 0.05 seconds" in str(exc_info.value)
+
+@pytest.mark.asyncio
+async def test_crawl_wait_timeout_when_rate_limited():
+    """Test that crawl_wait stops retrying a rate limited submission at its timeout."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(429, headers={"Retry-After": "1"})
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        with pytest.raises(SkrapeAPIError) as exc_info:
+            await skrape.crawl_wait(["https://example.com"], timeout=0.1)
+
+    assert not isinstance(exc_info.value, SkrapeRateLimitError)
+    assert "after 0.1 seconds" in str(exc_info.value)
+    assert loop.time() - started < 0.5
+    assert len(requests) == 1
+
+@pytest.mark.asyncio
+async def test_markdown_response_parsing():
+    """Test that markdown responses are parsed into typed usage info."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={
+            "result": "# Example",
+            "usage": {
+                "remaining": 99,
+                "rateLimit": {"remaining": 9, "baseLimit": 10, "burstLimit": 20, "reset": 1700000000}
+            }
+        })
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        response = await skrape.markdown("https://example.com")
+
+    assert response.result == "# Example"
+    assert response.usage.remaining == 99
+    assert response.usage.rateLimit.burstLimit == 20
+    assert response.usage.rateLimit.reset == 1700000000
+
+@pytest.mark.asyncio
+async def test_markdown_response_coercion():
+    """Test that loosely typed markdown responses are still validated by Pydantic."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={
+            "result": "# Example",
+            "usage": {
+                "remaining": "99",
+                "rateLimit": {"remaining": 9, "baseLimit": 10, "burstLimit": 20, "reset": 1700000000}
+            }
+        })
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        response = await skrape.markdown("https://example.com")
+        assert response.usage.remaining == 99
+
+        with pytest.raises(ValidationError):
+            await skrape.markdown_bulk(["https://example.com"])
+
+@pytest.mark.asyncio
+async def test_run_crawls():
+    """Test running several crawl jobs concurrently until they all finish."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            job_id = json.loads(request.content)["urls"][0]
+            return httpx.Response(200, json={"result": {"jobId": job_id, "status": "PENDING"}})
+        job_id = request.url.params["jobId"]
+        return httpx.Response(200, json={"result": {"jobId": job_id, "status": "COMPLETED", "result": [job_id]}})
+
+    batches = [["https://example.com"], ["https://example.org"], ["https://example.net"]]
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        jobs = await skrape.run_crawls(batches, {"renderJs": False})
+
+    assert [job.result for job in jobs] == batches
+    assert all(job.status == "COMPLETED" for job in jobs)
+
+@pytest.mark.asyncio
+async def test_reenter_client():
+    """Test that the client can be used again after its async with block exits."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"result": {"jobId": "job_1", "status": "RUNNING"}})
+
+    skrape = Skrape(api_key="test_key", transport=httpx.MockTransport(handler))
+    async with skrape:
+        assert (await skrape.get_job("job_1")).status == "RUNNING"
+    assert skrape.client.is_closed
+
+    async with skrape:
+        assert (await skrape.get_job("job_1")).status == "RUNNING"
+
+    # Calls outside an async with block reopen the client as well
+    assert (await skrape.get_job("job_1")).status == "RUNNING"
+    await skrape.client.aclose()
+
+@pytest.mark.asyncio
+async def test_invalid_job_response():
+    """Test that job fields returned by the server are validated."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"result": {"jobId": 123, "status": None}})
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        with pytest.raises(ValidationError):
+            await skrape.get_job("job_1")
+
+@pytest.mark.asyncio
+async def test_extract_many_cancels_on_error():
+    """Test that a failed extract cancels the others still in flight."""
+    cancelled = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal cancelled
+        if json.loads(request.content)["url"] == "https://example.com/bad":
+            return httpx.Response(401)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return httpx.Response(200, json={"result": {"title": "", "description": ""}})
+
+    urls = ["https://example.com/1", "https://example.com/bad", "https://example.com/2"]
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        with pytest.raises(SkrapeAPIError):
+            await asyncio.wait_for(skrape.extract_many(urls, SimpleSchema), timeout=5)
+        with pytest.raises(ValueError):
+            await skrape.extract_many(urls, SimpleSchema, max_concurrency=0)
+
+    assert cancelled == 2
+
+@pytest.mark.asyncio
+async def test_wait_for_job_timeout_when_rate_limited():
+    """Test that rate limit retries don't hold wait_for_job past its timeout."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "30"})
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        with pytest.raises(SkrapeAPIError) as exc_info:
+            await asyncio.wait_for(
+                skrape.wait_for_job("job_1", timeout=0.1, initial_interval=0.001),
+                timeout=2
+            )
+        assert "Timed out" in str(exc_info.value)
+
+@pytest.mark.asyncio
+async def test_iter_job_results_shapes():
+    """Test streaming results from flat responses, with rate limit retries."""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"jobId": "job_1", "status": "COMPLETED", "result": ["# Example"]}),
+        httpx.Response(200, json={"result": {"jobId": "job_1", "status": "RUNNING", "item": 5, "result": None}}),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        assert [item async for item in skrape.iter_job_results("job_1")] == ["# Example"]
+        assert [item async for item in skrape.iter_job_results("job_1")] == []
+
+@pytest.mark.asyncio
+async def test_iter_job_results_without_ijson(monkeypatch):
+    """Test that results read without ijson match the streamed ones."""
+    async def collect(result):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"result": {"jobId": "job_1", "status": "COMPLETED", "result": result}})
+
+        async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+            return [item async for item in skrape.iter_job_results("job_1")]
+
+    results = [["# Example", {"title": "Example"}], {"title": "Example", "description": ""}, "# md"]
+    streamed = [await collect(result) for result in results]
+    monkeypatch.setattr(client_module, "ijson", None)
+    read = [await collect(result) for result in results]
+
+    assert read == streamed == [["# Example", {"title": "Example"}], [], []]
+
+@pytest.mark.asyncio
+async def test_iter_job_results_errors():
+    """Test that failed jobs and truncated bodies raise SkrapeAPIError."""
+    responses = [
+        httpx.Response(200, json={"result": {"jobId": "job_1", "status": "FAILED", "error": "Crawl failed"}}),
+        httpx.Response(200, content=b'{"result": {"jobId": "job_1", "status": "COMPLETED", "result": ["# Ex'),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    async with Skrape(api_key="test_key", transport=httpx.MockTransport(handler)) as skrape:
+        with pytest.raises(SkrapeAPIError) as exc_info:
+            [item async for item in skrape.iter_job_results("job_1")]
+        assert "Crawl failed" in str(exc_info.value)
+
+        with pytest.raises(SkrapeAPIError) as exc_info:
+            [item async for item in skrape.iter_job_results("job_1")]
+        assert "Invalid job response" in str(exc_info.value)
+
+class RecordingTransport(httpx.MockTransport):
+    """Mock transport that records whether it has been closed."""
+    closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+def record_shared_pools(monkeypatch) -> list:
+    """Make shared pools use RecordingTransports and return the list of those created."""
+    created = []
+
+    def make_transport(limits: httpx.Limits) -> RecordingTransport:
+        transport = RecordingTransport(lambda request: httpx.Response(200, json={"jobId": "job_1", "status": "COMPLETED"}))
+        created.append(transport)
+        return transport
+
+    monkeypatch.setattr(client_module, "_make_transport", make_transport)
+    return created
+
+@pytest.mark.asyncio
+async def test_shared_pool_closed_by_last_client(monkeypatch):
+    """Test that clients on one loop share a pool that the last client to close closes."""
+    created = record_shared_pools(monkeypatch)
+
+    first = Skrape(api_key="key_a", shared_transport=True)
+    second = Skrape(api_key="key_b", shared_transport=True)
+    await first.get_job("job_1")
+    await second.get_job("job_1")
+    assert len(created) == 1
+    assert len(client_module._SHARED_POOLS) == 1
+
+    await first.client.aclose()
+    assert not created[0].closed
+    await second.client.aclose()
+    assert created[0].closed
+    assert not client_module._SHARED_POOLS
+
+def test_shared_pools_dropped_with_their_loop(monkeypatch):
+    """Test that pools on closed loops are dropped, even if a client was never closed."""
+    created = record_shared_pools(monkeypatch)
+
+    async def use_client(close: bool) -> None:
+        skrape = Skrape(api_key="test_key", shared_transport=True)
+        await skrape.get_job("job_1")
+        if close:
+            await skrape.client.aclose()
+
+    asyncio.run(use_client(close=False))
+    assert len(client_module._SHARED_POOLS) == 1
+    asyncio.run(use_client(close=True))
+    assert len(created) == 2
+    assert created[1].closed
+    assert not client_module._SHARED_POOLS